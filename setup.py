@@ -76,6 +76,6 @@ setup(
         ],
     },
     test_suite="tests",
-    tests_require=["pytest"],
+    tests_require=["pytest", "pytest-xdist"],
     extras_require=requirements,
 )